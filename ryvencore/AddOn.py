@@ -29,7 +29,7 @@ To define a custom add-on:
 
 See :code:`ryvencore.addons` for examples.
 """
-from typing import Dict
+from typing import Dict, List
 
 from .Session import Session
 from .Flow import Flow
@@ -71,6 +71,17 @@ class AddOn(Base):
         """
         pass
 
+    def on_flows_loaded(self, flows: List[Flow]):
+        """
+        *VIRTUAL*
+
+        Called once after :code:`Session.load()` created all flows of a
+        project, each of which was already announced individually through
+        :code:`AddOn.on_flow_created()`. This is a good place for work that
+        should be done once per project instead of once per flow.
+        """
+        pass
+
     def on_node_created(self, node: Node):
         """
         *VIRTUAL*
@@ -3,8 +3,8 @@ This module defines the :code:`Base` class for most internal components,
 implementing features such as a unique ID, a system for save and load,
 and a very minimal event system.
 """
-from typing import Dict, Set
-from bisect import insort
+from typing import Dict, List, Optional, Callable
+from weakref import WeakValueDictionary
 
 class IDCtr:
     """
@@ -14,6 +14,8 @@ class IDCtr:
     and require according system support which might not be available everywhere.
     """
 
+    __slots__ = ('ctr',)
+
     def __init__(self):
         self.ctr = -1
 
@@ -29,6 +31,20 @@ class IDCtr:
             self.ctr = cnt
 
 
+def _compile_dispatch(callbacks: List[Callable]) -> Callable:
+    """
+    Generates a function calling all given callbacks in order as straight-line
+    code, so emitting doesn't need to loop over the callbacks.
+    """
+    names = [f'_cb{i}' for i in range(len(callbacks))]
+    src = 'def _dispatch(*args):\n' + (
+        ''.join(f'    {n}(*args)\n' for n in names) if names else '    pass\n'
+    )
+    namespace = dict(zip(names, callbacks))
+    exec(compile(src, '<ryvencore.Base.Event>', 'exec'), namespace)
+    return namespace['_dispatch']
+
+
 class Event:
     """
     Implements a generalization of the observer pattern, with additional
@@ -36,13 +52,23 @@ class Event:
     is called. The default priority is 0.
     ryvencore itself may use negative priorities internally to ensure
     precedence of internal observers over all user-defined ones.
+
+    Once an event was emitted :code:`_DISPATCH_THRESHOLD` times without
+    changes to its subscriptions, a dispatch function calling the callbacks
+    directly is generated and used for subsequent emits.
     """
 
+    __slots__ = ('args', '_slot_priorities', '_emit_order', '_emit_count', '_dispatch')
+
+    _DISPATCH_THRESHOLD = 16
+
     def __init__(self, *args):
         self.args = args
-        self._slots: Dict[int, Set] = {}
-        self._ordered_slot_pos = []
-        self._slot_priorities = {}
+        self._slot_priorities: Dict[Callable, int] = {}
+        # callbacks sorted by priority, rebuilt lazily once the subscriptions changed
+        self._emit_order: Optional[List[Callable]] = None
+        self._emit_count = 0
+        self._dispatch: Optional[Callable] = None
 
     def sub(self, callback, nice=0):
         """
@@ -52,29 +78,29 @@ class Event:
         :code:`nice` can range from -5 to 10.
         Users of ryvencore are not allowed to use negative priorities.
         """
-        assert -5 <= nice <= 10
-        assert self._slot_priorities.get(callback) is None
+        if __debug__ and not -5 <= nice <= 10:
+            raise ValueError(f'nice must range from -5 to 10, got {nice}')
 
-        cb_set = self._slots.get(nice)
-        if cb_set is None:
-            cb_set = self._slots[nice] = set()
-            insort(self._ordered_slot_pos, nice)
-            
-        cb_set.add(callback)
-        self._slot_priorities[callback] = nice
+        # check and insert with a single lookup
+        priorities = self._slot_priorities
+        n = len(priorities)
+        priorities.setdefault(callback, nice)
+        if len(priorities) == n:
+            raise ValueError(f'{callback} is already subscribed')
+
+        self._invalidate()
 
     def unsub(self, callback):
         """
         De-registers a callback function. The function must have been added previously.
         """
-        nice = self._slot_priorities[callback]
-        cb_set = self._slots[nice]
-        cb_set.remove(callback)
         del self._slot_priorities[callback]
+        self._invalidate()
 
-        if len(cb_set) == 0:
-            del self._slots[nice]
-            self._ordered_slot_pos.remove(nice)
+    def _invalidate(self):
+        self._emit_order = None
+        self._emit_count = 0
+        self._dispatch = None
 
     def emit(self, *args):
         """
@@ -82,10 +108,25 @@ class Event:
         given by :code:`args`.
         """
 
-        # notice we're using the ordered list to run through the events
-        for nice in self._ordered_slot_pos:
-            for cb in self._slots[nice]:
-                cb(*args)
+        dispatch = self._dispatch
+        if dispatch is not None:
+            dispatch(*args)
+            return
+
+        order = self._emit_order
+        if order is None:
+            # sorted() is stable, so callbacks of the same priority are called
+            # in the order they were registered
+            priorities = self._slot_priorities
+            order = self._emit_order = sorted(priorities, key=priorities.__getitem__)
+
+        self._emit_count += 1
+        if self._emit_count >= self._DISPATCH_THRESHOLD:
+            # the subscriptions seem to be stable
+            self._dispatch = _compile_dispatch(order)
+
+        for cb in order:
+            cb(*args)
 
 
 class Base:
@@ -107,14 +148,16 @@ class Base:
           functions for its GUI components
     """
 
+    # '__weakref__' is required for _prev_id_objs
+    __slots__ = ('global_id', 'prev_global_id', 'prev_version', '__weakref__')
+
     # static attributes
 
     _global_id_ctr = IDCtr()
 
-    # TODO: this produces a memory leak, because the objects are never removed
-    #  from the dict. It shouldn't be a problem as long as PREF_GLOBAL_ID is
-    #  only used for loading, but I'd be happy to avoid this if possible
-    _prev_id_objs = {}
+    # objects are only weakly referenced, so entries disappear once the
+    # loaded object dies and the dict doesn't keep objects alive forever
+    _prev_id_objs = WeakValueDictionary()
 
     @classmethod
     def obj_from_prev_id(cls, prev_id: int):
@@ -137,12 +180,26 @@ class Base:
     # optional version which, if set, will be stored in :code:`data()`
     version: str = None
 
+    # skeleton of the dict returned by :code:`data()`, precomputed per class;
+    # notice that :code:`version` is therefore read when the class is created
+    _data_template: Dict = {'GID': None}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._data_template = (
+            {'GID': None, 'version': cls.version}
+            if cls.version is not None
+            else {'GID': None}
+        )
+
     # non-static
 
     def __init__(self):
-        self.global_id = self._global_id_ctr.count()
-
-        # the following attributes are set in :code:`load()`
+        # inlined IDCtr.count(), this runs for every single component
+        ctr = Base._global_id_ctr
+        ctr.ctr += 1
+        self.global_id = ctr.ctr
+        # only set by load(), but read before that (e.g. by add-ons)
         self.prev_global_id = None
         self.prev_version = None
 
@@ -151,14 +208,9 @@ class Base:
         Convert the object to a JSON compatible dict.
         Reserved field names are 'GID' and 'version'.
         """
-        return {
-            'GID': self.global_id,
-
-            # version optional
-            **({'version': self.version}
-               if self.version is not None
-               else {})
-        }
+        d = self._data_template.copy()
+        d['GID'] = self.global_id
+        return d
 
     def load(self, data: Dict):
         """
@@ -138,7 +138,19 @@ class Flow(Base):
         self.graph_adj_rev: Dict[NodeInput, NodeOutput] = {}     # reverse adjacency; reverse of graph_adj
 
         self.alg_mode = FlowAlg.DATA
-        self.executor: FlowExecutor = executor_from_flow_alg(self.alg_mode)(self)
+        self._executor: FlowExecutor = None
+        self.executor = executor_from_flow_alg(self.alg_mode)(self)
+
+    @property
+    def executor(self) -> FlowExecutor:
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: FlowExecutor):
+        # nodes hold the executor's bound methods, see Node._bind_executor()
+        self._executor = executor
+        for node in self.nodes:
+            node._bind_executor(executor)
 
     def load(self, data: Dict):
         """Loading a flow from data as previously returned by ``Flow.data()``."""
@@ -176,10 +188,7 @@ class Flow(Base):
         for n_c in nodes_data:
 
             # find class
-            node_class = node_from_identifier(
-                n_c['identifier'],
-                self.session.nodes.union(self.session.invisible_nodes)
-            )
+            node_class = node_from_identifier(n_c['identifier'], self.session._node_ids)
 
             node = self.create_node(node_class, n_c)
             nodes.append(node)
@@ -190,24 +199,25 @@ class Flow(Base):
 
 
     def _set_output_values_from_data(self, nodes: List[Node], data: List):
+        get_data_type = self.session.data_types.get
+
         for d in data:
+            # find Data class, it's the same for all dependent outputs
+            dt_id = d['data']['identifier']
+            if dt_id == 'Data':
+                data_type = Data
+            else:
+                data_type = get_data_type(dt_id)
+
+                if data_type is None:
+                    print_err(f'Tried to use unregistered Data type '
+                              f'{dt_id} while loading. Skipping. '
+                              f'Please register data types before using them.')
+                    continue
+
             indices = d['dependent node outputs']
             indices_paired: zip[tuple[int, int]] = zip(indices[0::2], indices[1::2])
             for node_index, output_index in indices_paired:
-
-                # find Data class
-                dt_id = d['data']['identifier']
-                if dt_id == 'Data':
-                    data_type = Data
-                else:
-                    data_type = self.session.data_types.get(dt_id)
-
-                    if data_type is None:
-                        print_err(f'Tried to use unregistered Data type '
-                                  f'{dt_id} while loading. Skipping. '
-                                  f'Please register data types before using them.')
-                        continue
-
                 nodes[node_index]._outputs[output_index].val = data_type(load_from=d['data'])
 
 
@@ -245,6 +255,8 @@ class Flow(Base):
         """
 
         self.nodes.append(node)
+        # the executor might have changed while the node was removed
+        node._bind_executor(self.executor)
 
         self.node_successors[node] = []
 
@@ -554,7 +566,7 @@ class Flow(Base):
                             'parent node index': i,
                             'output port index': j,
                             'connected node': nodes.index(inp.node),
-                            'connected input port index': inp.node.inputs.index(inp),
+                            'connected input port index': inp._index,
                         })
 
         return data
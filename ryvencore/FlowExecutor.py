@@ -86,7 +86,7 @@ class DataFlowNaive(FlowExecutor):
         out.val = data
 
         for inp in self.graph[out]:
-            inp.node.update(inp=inp.node._inputs.index(inp))
+            inp.node.update(inp=inp._index)
 
     # Node.exec_output() =>
     def exec_output(self, node: Node, index: int):
@@ -95,17 +95,17 @@ class DataFlowNaive(FlowExecutor):
             return
 
         for inp in self.graph[out]:
-            inp.node.update(inp=inp.node._inputs.index(inp))
+            inp.node.update(inp=inp._index)
 
     def conn_added(self, out: NodeOutput, inp: NodeInput, silent=False):
         if not silent:
             # update input
-            inp.node.update(inp=inp.node._inputs.index(inp))
+            inp.node.update(inp=inp._index)
 
     def conn_removed(self, out, inp, silent=False):
         if not silent:
             # update input
-            inp.node.update(inp=inp.node._inputs.index(inp))
+            inp.node.update(inp=inp._index)
 
 
 class DataFlowOptimized(DataFlowNaive):
@@ -295,7 +295,7 @@ class DataFlowOptimized(DataFlowNaive):
         if self.output_updated[out]:
             # same procedure for data and exec connections
             for inp in self.graph[out]:
-                inp.node.update(inp=inp.node._inputs.index(inp))
+                inp.node.update(inp=inp._index)
 
         # decrease wait count of successors
         for inp in self.graph[out]:
@@ -356,7 +356,7 @@ class ExecFlowNaive(FlowExecutor):
     # Node.exec_output() =>
     def exec_output(self, node, index):
         for inp in self.graph[node._outputs[index]]:
-            inp.node.update(inp.node._inputs.index(inp))
+            inp.node.update(inp._index)
 
 
 def executor_from_flow_alg(algorithm: FlowAlg):
@@ -1,9 +1,10 @@
+import sys
 import traceback
-from typing import List, Optional, Dict, Union, TYPE_CHECKING
+from typing import List, Optional, Dict, Type, Union, FrozenSet, TYPE_CHECKING
 
 from .Base import Base, Event
 
-from .NodePort import NodeInput, NodeOutput
+from .NodePort import NodePort, NodeInput, NodeOutput
 from .NodePortType import NodeInputType, NodeOutputType
 from .data.Data import Data
 from .InfoMsgs import InfoMsgs
@@ -11,11 +12,11 @@ from .utils import serialize, deserialize
 from .RC import ProgressState
 
 from numbers import Real
-from copy import copy
 
 if TYPE_CHECKING:
     from .Flow import Flow
     from .Session import Session
+    from .FlowExecutor import FlowExecutor
 
 class Node(Base):
     """
@@ -49,6 +50,9 @@ class Node(Base):
     identifier_prefix: str = None
     """becomes part of the identifier if set; can be useful for grouping nodes"""
 
+    # frozen version of legacy_identifiers for fast membership tests
+    _legacy_identifier_set: FrozenSet[str] = frozenset()
+
     #
     # INITIALIZATION
     #
@@ -57,9 +61,15 @@ class Node(Base):
     def _build_identifier(cls):
         """
         Sets the identifier to the class name and prepends f"{identifier_prefix}." if
-        the identifier prefix is set.
+        the identifier prefix is set. Only has an effect the first time it's
+        called on a class, so registering a node class again (e.g. in another
+        session) doesn't prepend the prefix again.
         """
 
+        # checked in the class's own namespace, subclasses need their own identifier
+        if cls.__dict__.get('_identifier_built', False):
+            return
+
         prefix = ''
         if cls.identifier_prefix is not None:
             prefix = cls.identifier_prefix + '.'
@@ -67,9 +77,12 @@ class Node(Base):
         if cls.identifier is None:
             cls.identifier = cls.__name__
 
-        cls.identifier = prefix + cls.identifier
+        # interned, identifiers are dict keys (see Session._node_ids) and stored in every node's data
+        cls.identifier = sys.intern(prefix + cls.identifier)
 
         # notice that we do not touch the legacy identifier fields
+        cls._legacy_identifier_set = frozenset(sys.intern(i) for i in cls.legacy_identifiers)
+        cls._identifier_built = True
 
     def __init__(self, params):
         Base.__init__(self)
@@ -80,6 +93,7 @@ class Node(Base):
         
         self._inputs: List[NodeInput] = []
         self._outputs: List[NodeOutput] = []
+        self._is_active: Optional[bool] = None     # cached result of is_active()
 
         self.loaded = False
         self.load_data = None
@@ -88,6 +102,8 @@ class Node(Base):
         self.block_updates = False
 
         self._progress = None
+
+        self._bind_executor(flow.executor)
         
         # events
         self.updating = Event(int)
@@ -110,21 +126,21 @@ class Node(Base):
         if not inputs_data and not outputs_data:
             # generate initial ports
 
-            for i in range(len(self.init_inputs)):
-                inp = self.init_inputs[i]
+            create_input = self.create_input
+            for inp in self.init_inputs:
+                create_input(label=inp.label, type_=inp.type_, default=inp.default, allowed_data=inp.allowed_data)
 
-                self.create_input(label=inp.label, type_=inp.type_, default=inp.default, allowed_data=inp.allowed_data)
-
-            for o in range(len(self.init_outputs)):
-                out = self.init_outputs[o]
-                self.create_output(out.label, out.type_, allowed_data=out.allowed_data)
+            create_output = self.create_output
+            for out in self.init_outputs:
+                create_output(out.label, out.type_, allowed_data=out.allowed_data)
 
         else:
             # load from data
             # initial ports specifications are irrelevant then
 
+            create_input = self.create_input
             for inp in inputs_data:
-                self.create_input(load_from=inp)
+                create_input(load_from=inp)
 
                 # if 'val' in inp:
                 #     # this means the input is 'data' and did not have any connections,
@@ -132,8 +148,9 @@ class Node(Base):
                 #     # in the front end which has probably overridden the Node.input() method
                 #     self.inputs[-1].val = deserialize(inp['val'])
 
+            create_output = self.create_output
             for out in outputs_data:
-                self.create_output(load_from=out)
+                create_output(load_from=out)
 
     def after_placement(self):
         """Called from Flow when the nodes gets added."""
@@ -151,6 +168,16 @@ class Node(Base):
     
     """
 
+    def _bind_executor(self, executor: 'FlowExecutor'):
+        """
+        Stores the executor's methods the algorithm-related methods below delegate to,
+        which saves the lookups on every call. Called by the flow whenever its executor changes.
+        """
+        self._exec_update = executor.update_node
+        self._exec_input = executor.input
+        self._exec_output = executor.exec_output
+        self._exec_set_output_val = executor.set_output_val
+
     # notice that all the below methods check whether the flow currently 'runs with an executor', which means
     # the flow is running in a special execution mode, in which case all the algorithm-related methods below are
     # handled by the according executor
@@ -171,7 +198,7 @@ class Node(Base):
 
         # invoke update_event
         self.updating.emit(inp)
-        self.flow.executor.update_node(self, inp)
+        self._exec_update(self, inp)
 
     def update_err(self, e):
         InfoMsgs.write_err('EXCEPTION in', self.title, '\n', traceback.format_exc())
@@ -186,7 +213,7 @@ class Node(Base):
 
         InfoMsgs.write('input called in', self.title, ':', index)
 
-        return self.flow.executor.input(self, index)
+        return self._exec_input(self, index)
     
     def input_payload(self, index: int):
         """
@@ -208,23 +235,21 @@ class Node(Base):
 
         InfoMsgs.write('executing output', index, 'in:', self.title)
 
-        self.flow.executor.exec_output(self, index)
+        self._exec_output(self, index)
 
     def set_output_val(self, index: int, data: Data):
         """
         Sets the value of a data output causing activation of all connections in data mode.
         """
         
-        out = self._outputs[index]
-        data_type = (out.allowed_data 
-                    if out.allowed_data and issubclass(out.allowed_data, Data)
-                    else Data) 
-        
-        assert isinstance(data, data_type), f"Output value must be of type {data_type.__module__}.{data_type.__name__}"
+        if __debug__:
+            data_type = self._outputs[index]._data_type
+            assert type(data) is data_type or isinstance(data, data_type), \
+                f"Output value must be of type {data_type.__module__}.{data_type.__name__}"
 
         InfoMsgs.write('setting output', index, 'in', self.title)
 
-        self.flow.executor.set_output_val(self, index, data)
+        self._exec_set_output_val(self, index, data)
         
         self.output_updated.emit(self, index, self._outputs[index], data)
     
@@ -337,12 +362,9 @@ class Node(Base):
         if load_from is not None:
             inp.load(load_from)
 
-        if insert is not None:
-            self._inputs.insert(insert, inp)
-            index = insert
-        else:
-            self._inputs.append(inp)
-            index = len(self._inputs) - 1
+        index = self._insert_port(self._inputs, inp, insert)
+        self._update_port_indices(self._inputs, index)
+        self._is_active = None
 
         self.input_added.emit(self, index, inp)
 
@@ -363,7 +385,11 @@ class Node(Base):
         if out is not None:
             self.flow.connect_nodes(out, inp)
 
-        self._inputs.remove(inp)
+        if index < 0:
+            index += len(self._inputs)
+        del self._inputs[index]
+        self._update_port_indices(self._inputs, index)
+        self._is_active = None
 
         self.input_removed.emit(self, index, inp)
 
@@ -383,12 +409,9 @@ class Node(Base):
         if load_from is not None:
             out.load(load_from)
 
-        if insert is not None:
-            self._outputs.insert(insert, out)
-            index = insert
-        else:
-            self._outputs.append(out)
-            index = len(self._outputs) - 1
+        index = self._insert_port(self._outputs, out, insert)
+        self._update_port_indices(self._outputs, index)
+        self._is_active = None
 
         self.output_added.emit(self, index, out)
 
@@ -408,7 +431,11 @@ class Node(Base):
         for inp in self.flow.connected_inputs(out):
             self.flow.connect_nodes(out, inp)
 
-        self._outputs.remove(out)
+        if index < 0:
+            index += len(self._outputs)
+        del self._outputs[index]
+        self._update_port_indices(self._outputs, index)
+        self._is_active = None
 
         self.output_removed.emit(self, index, out)
 
@@ -425,7 +452,7 @@ class Node(Base):
     @property
     def progress(self) -> Union[ProgressState, None]:
         """Copy of the current progress of execution in the node, or None if there's no active progress"""
-        return copy(self._progress) if self._progress is not None else None
+        return self._progress._clone() if self._progress is not None else None
     
     @progress.setter
     def progress(self, progress_state: Union[ProgressState, None]):
@@ -457,14 +484,41 @@ class Node(Base):
     
     """
 
+    @staticmethod
+    def _insert_port(ports: List[NodePort], port: NodePort, insert: Optional[int]) -> int:
+        """
+        Inserts a port like ``list.insert()`` (or appends it if ``insert`` is None)
+        and returns the index the port actually ended up at, since ``list.insert()``
+        clamps indices that are out of range and counts negative ones from the end.
+        """
+        n = len(ports)
+        if insert is None:
+            index = n
+        elif insert < 0:
+            index = max(0, n + insert)
+        else:
+            index = min(insert, n)
+        ports.insert(index, port)
+        return index
+
+    @staticmethod
+    def _update_port_indices(ports: List[NodePort], start: int = 0):
+        """
+        Updates the cached indices of the ports from index ``start`` on,
+        so executors don't need to search the ports lists.
+        """
+        for i in range(start, len(ports)):
+            ports[i]._index = i
+
     def is_active(self):
-        for i in self._inputs:
-            if i.type_ == 'exec':
-                return True
-        for o in self._outputs:
-            if o.type_ == 'exec':
-                return True
-        return False
+        """
+        Returns whether the node has any exec ports. The result is cached
+        until the node's ports change.
+        """
+        if self._is_active is None:
+            self._is_active = any(p.type_ == 'exec' for p in self._inputs) or \
+                any(p.type_ == 'exec' for p in self._outputs)
+        return self._is_active
 
     def _inp_connected(self, index):
         return self.flow.connected_output(self._inputs[index]) is not None
@@ -490,6 +544,7 @@ class Node(Base):
         #   remove initial ports
         self._inputs = []
         self._outputs = []
+        self._is_active = None
         #   load from data
         self._setup_ports(data['inputs'], data['outputs'])
 
@@ -518,18 +573,16 @@ class Node(Base):
         :code:`Node.load()`.
         """
 
-        d = {
-            **super().data(),
+        d = super().data()
 
-            'identifier': self.identifier,
-            'version': self.version,    # this overrides the version field from Base
+        d['identifier'] = self.identifier
+        d['version'] = self.version     # this overrides the version field from Base
 
-            'state data': serialize(self.get_state()),
-            'additional data': self.additional_data(),
+        d['state data'] = serialize(self.get_state())
+        d['additional data'] = self.additional_data()
 
-            'inputs': [i.data() for i in self._inputs],
-            'outputs': [o.data() for o in self._outputs],
-        }
+        d['inputs'] = [i.data() for i in self._inputs]
+        d['outputs'] = [o.data() for o in self._outputs]
 
         # extend with data from addons
         for name, addon in self.session.addons.items():
@@ -539,19 +592,20 @@ class Node(Base):
         return d
 
 
-def node_from_identifier(identifier: str, nodes: List[Node]):
+def node_from_identifier(identifier: str, nodes_by_id: Dict[str, Type[Node]]):
+    """
+    Looks up a node class by its current or a legacy identifier, see
+    :code:`Session._node_ids`.
+    """
+
+    try:
+        return nodes_by_id[identifier]
+    except KeyError:
+        pass
 
-    for nc in nodes:
-        if nc.identifier == identifier:
-            return nc
-    else:  # couldn't find a node with this identifier => search for identifier_comp
-        for nc in nodes:
-            if identifier in nc.legacy_identifiers:
-                return nc
-        else:
-            raise Exception(
-                f'could not find node class with identifier \'{identifier}\'. '
-                f'if you changed your node\'s class name, make sure to add the old '
-                f'identifier to the identifier_comp list attribute to provide '
-                f'backwards compatibility.'
-            )
\ No newline at end of file
+    raise Exception(
+        f'could not find node class with identifier \'{identifier}\'. '
+        f'if you changed your node\'s class name, make sure to add the old '
+        f'identifier to the identifier_comp list attribute to provide '
+        f'backwards compatibility.'
+    )
\ No newline at end of file
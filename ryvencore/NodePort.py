@@ -1,3 +1,4 @@
+import sys
 from typing import Optional, Dict, Type, Tuple, TYPE_CHECKING
 
 from .Base import Base
@@ -12,36 +13,51 @@ if TYPE_CHECKING:
 class NodePort(Base):
     """Base class for inputs and outputs of nodes"""
 
+    # nodes can have many ports, slots keep them small
+    __slots__ = ('node', 'io_pos', 'type_', 'label_str', 'load_data', '_allowed_data', '_index')
+
     def __init__(self, node, io_pos: PortObjPos, type_: str, label_str: str, allowed_data: Optional[Type[Data]] = None):
         Base.__init__(self)
 
         self.node: Node = node
         self.io_pos = io_pos
-        self.type_ = type_
+        self.type_ = sys.intern(type_)
         self.label_str = label_str
         self.load_data = None
         self.allowed_data = allowed_data
 
+        # position in the node's inputs or outputs, maintained by the node
+        self._index: Optional[int] = None
+
     def load(self, data: Dict):
         self.load_data = data
-        self.type_ = data['type']
+        self.type_ = sys.intern(data['type'])
         self.label_str = data['label']
         # allowed data - backwards compatibility
         data_id = data.get('allowed_data')
         if data_id is not None:
-            self.allowed_data = self.node.session.get_data_type(data_id)
+            self.allowed_data = self.node.session.data_types.get(data_id)
+
+    @property
+    def allowed_data(self) -> Optional[Type[Data]]:
+        return self._allowed_data
+
+    @allowed_data.setter
+    def allowed_data(self, allowed_data: Optional[Type[Data]]):
+        self._allowed_data = allowed_data
         
     def data(self) -> dict:
-        return {
-            **super().data(),
-            'type': self.type_,
-            'label': self.label_str,
-            'allowed_data': self.allowed_data.identifier if self.allowed_data is not None else None
-        }
+        d = super().data()
+        d['type'] = self.type_
+        d['label'] = self.label_str
+        d['allowed_data'] = self.allowed_data.identifier if self.allowed_data is not None else None
+        return d
 
 
 class NodeInput(NodePort):
 
+    __slots__ = ('default',)
+
     def __init__(self, node, type_: str, label_str: str = '', default: Optional[Data] = None, allowed_data: Optional[Type[Data]] = None):
         super().__init__(node, PortObjPos.INPUT, type_, label_str, allowed_data)
 
@@ -50,22 +66,39 @@ class NodeInput(NodePort):
     def load(self, data: Dict):
         super().load(data)
 
-        self.default = Data(load_from=data['default']) if 'default' in data else None
+        default_data = data.get('default')
+        if default_data is None:
+            self.default = None
+        else:
+            # restore the default's own Data type, plain Data if it's unknown
+            data_type = self.node.session.data_types.get(default_data['identifier'], Data)
+            self.default = data_type(load_from=default_data)
 
     def data(self) -> Dict:
-        default = {'default': self.default.data()} if self.default is not None else {}
-
-        return {
-            **super().data(),
-            **default,
-        }
+        d = super().data()
+        if self.default is not None:
+            d['default'] = self.default.data()
+        return d
 
 class NodeOutput(NodePort):
+
+    __slots__ = ('val', '_data_type')
+
     def __init__(self, node, type_: str, label_str: str = '', allowed_data: Optional[Type[Data]] = None):
         super().__init__(node, PortObjPos.OUTPUT, type_, label_str, allowed_data)
 
         self.val: Optional[Data] = None
 
+    @NodePort.allowed_data.setter
+    def allowed_data(self, allowed_data: Optional[Type[Data]]):
+        self._allowed_data = allowed_data
+        # resolves the type output values must have, see :code:`Node.set_output_val()`
+        self._data_type: Type[Data] = (
+            allowed_data
+            if allowed_data is not None and issubclass(allowed_data, Data)
+            else Data
+        )
+
     # def data(self) -> dict:
     #     data = super().data()
     #
@@ -81,19 +114,25 @@ def check_valid_conn(out: NodeOutput, inp: NodeInput) -> ConnValidType:
         An enum representing the check result
     """
     
-    if out.node == inp.node:
+    # identity checks, nodes and enum members are compared by identity anyway
+    if out.node is inp.node:
         return ConnValidType.SAME_NODE
     
-    if out.io_pos == inp.io_pos:
+    if out.io_pos is inp.io_pos:
         return ConnValidType.SAME_IO
     
-    if out.io_pos != PortObjPos.OUTPUT:
+    if out.io_pos is not PortObjPos.OUTPUT:
         return ConnValidType.IO_MISSMATCH
     
+    # type_ is interned, so this is an identity check for equal types
     if out.type_ != inp.type_:
         return ConnValidType.DIFF_ALG_TYPE
     
-    if not check_valid_data(out.allowed_data, inp.allowed_data):
+    # most connections either accept any data or use the same data type
+    # on both ends, which doesn't need the data type check
+    inp_data_type = inp.allowed_data
+    if inp_data_type is not None and out.allowed_data is not inp_data_type and \
+            not check_valid_data(out.allowed_data, inp_data_type):
         return ConnValidType.DATA_MISSMATCH
     
     return ConnValidType.VALID
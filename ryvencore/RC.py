@@ -157,3 +157,9 @@ class ProgressState:
     def as_percentage(self):
         """Returns a new progress state so that max_value = 1"""
         return ProgressState(1, self._value / self.max_value, self.message)
+
+    def _clone(self) -> 'ProgressState':
+        """Shallow copy, cheaper than :code:`copy.copy()`"""
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
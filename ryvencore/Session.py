@@ -1,6 +1,7 @@
 import importlib
-import glob
-import os.path
+import os
+import sys
+from itertools import chain
 from typing import List, Dict, Type, Optional, Set, TYPE_CHECKING
 
 from .data import Data 
@@ -8,18 +9,32 @@ from .data.built_in import get_built_in_data_types
 from .Base import Base, Event
 from .Flow import Flow
 from .InfoMsgs import InfoMsgs
-from .utils import pkg_version, pkg_path, load_from_file, print_err
+from .utils import pkg_version, pkg_path, load_from_file, print_err, get_all_subclasses
 from .Node import Node
 
 if TYPE_CHECKING:
     from AddOn import AddOn
-    
+
+
+def _is_addon_module(entry: os.DirEntry) -> bool:
+    """filter for the top-level modules of an addons directory"""
+    name = entry.name
+    return name.endswith('.py') and name != '__init__.py' \
+        and not name.startswith('.') and entry.is_file()
+
+
 class Session(Base):
     """
     The Session is the top level interface to your project. It mainly manages flows, nodes, and add-ons and
     provides methods for serialization and deserialization of the project.
     """
 
+    __slots__ = (
+        'flow_created', 'flow_renamed', 'flow_deleted', 'flows_loaded',
+        'addons', 'flows', 'nodes', 'invisible_nodes', '_node_ids', 'data_types',
+        'gui', 'init_data',
+    )
+
     version = pkg_version()
 
     def __init__(
@@ -33,12 +48,14 @@ class Session(Base):
         self.flow_created = Event(Flow)
         self.flow_renamed = Event(Flow, str)
         self.flow_deleted = Event(Flow)
+        self.flows_loaded = Event(list)     # all flows created by one load()
 
         # ATTRIBUTES
         self.addons: Dict[str, AddOn] = {}
         self.flows: List[Flow] = []
         self.nodes: Set[Type[Node]] = set()      # list of node CLASSES
         self.invisible_nodes: Set[Type[Node]] = set()
+        self._node_ids: Dict[str, Type[Node]] = {}    # current and legacy identifiers -> node class
         self.data_types: Dict[str, Type[Data]] = {}
         self.gui: bool = gui
         self.init_data = None
@@ -65,18 +82,23 @@ class Session(Base):
         if location is None:
             location = pkg_path('addons/')
 
-        # discover all top-level modules in the given location
-        addons = filter(lambda p: not p.endswith('__init__.py'), glob.glob(location + '/*.py'))
+        # discover all top-level modules in the given location;
+        # a location that doesn't exist simply doesn't contain any addons
+        try:
+            with os.scandir(location) as entries:
+                addons = [e for e in entries if _is_addon_module(e)]
+        except (FileNotFoundError, NotADirectoryError):
+            return
 
-        for path in addons:
+        for entry in addons:
             # extract 'addon' object from module
-            addon, = load_from_file(path, ['addon'])
+            addon, = load_from_file(entry.path, ['addon'])
 
             if addon is None:
                 continue
 
             # register addon
-            modname = os.path.split(path)[-1][:-3]
+            modname = entry.name[:-3]
             self.addons[modname] = addon
 
             addon.register(self)
@@ -85,6 +107,7 @@ class Session(Base):
             # establish event connections
             self.flow_created.sub(addon.on_flow_created, nice=-5)
             self.flow_deleted.sub(addon.on_flow_destroyed, nice=-5)
+            self.flows_loaded.sub(addon.on_flows_loaded, nice=-5)
             for f in self.flows:
                 addon.connect_flow_events(f)
 
@@ -95,8 +118,12 @@ class Session(Base):
         Do not attempt to place nodes in flows that haven't been registered in the session before.
         """
 
+        # node_types may be any iterable, it's traversed once
+        node_types = list(node_types)
         for n in node_types:
-            self.register_node_type(n)
+            n._build_identifier()
+            self._index_node_type(n)
+        self.nodes.update(node_types)
 
 
     def register_node_type(self, node_class: Type[Node]):
@@ -106,6 +133,7 @@ class Session(Base):
 
         node_class._build_identifier()
         self.nodes.add(node_class)
+        self._index_node_type(node_class)
 
 
     def unregister_node(self, node_class: Type[Node]):
@@ -116,13 +144,29 @@ class Session(Base):
 
         self.nodes.remove(node_class)
 
+        # another node class might share a legacy identifier, so rebuild
+        self._node_ids.clear()
+        for nc in self.nodes:
+            self._index_node_type(nc)
+
+
+    def _index_node_type(self, node_class: Type[Node]):
+        """
+        Adds a node class to the identifier lookup used when loading flows.
+        A current identifier always takes precedence over a legacy one.
+        """
+
+        self._node_ids[node_class.identifier] = node_class
+        for legacy_id in node_class._legacy_identifier_set:
+            self._node_ids.setdefault(legacy_id, node_class)
+
 
     def all_node_objects(self) -> List[Node]:
         """
         Returns a list of all node objects instantiated in any flow.
         """
 
-        return [n for f in self.flows for n in f.nodes]
+        return list(chain.from_iterable(f.nodes for f in self.flows))
 
 
     def register_data_type(self, data_type_class: Type[Data]):
@@ -134,14 +178,18 @@ class Session(Base):
         data_type_class._build_identifier()
         
         id = data_type_class.identifier
-        if id == 'Data' or id in self.data_types:
+
+        # check and insert with a single lookup, nothing is
+        # inserted if the identifier is already registered
+        data_types = self.data_types
+        n = len(data_types)
+        if id != 'Data':
+            data_types.setdefault(sys.intern(id), data_type_class)
+        if len(data_types) == n:
             print_err(
                 f'Data type identifier "{id}" is already registered. '
                 f'skipping. You can use the "identifier" attribute of '
                 f'your Data subclass.')
-            return
-
-        self.data_types[id] = data_type_class
 
 
     def register_data_types(self, data_type_classes: List[Type[Data]]):
@@ -156,11 +204,11 @@ class Session(Base):
     
     def register_data_types_by_base(self, base_type: Type[Data]):
         """
-        Registers :code:`Data` subclasses that belong to a base class.
+        Registers a base :code:`Data` class and all its (also indirect) subclasses.
         """
         
         self.register_data_type(base_type)
-        for data_type in base_type.__subclasses__():
+        for data_type in get_all_subclasses(base_type):
             self.register_data_type(data_type)
             
     
@@ -257,21 +305,27 @@ class Session(Base):
         new_flows = []
 
         #   backward compatibility
-        if 'scripts' in data:
-            flows_data = {
-                title: script_data['flow']
-                for title, script_data in data['scripts'].items()
-            }
-        elif isinstance(data['flows'], list):
-            flows_data = {
-                f'Flow {i}': flow_data
-                for i, flow_data in enumerate(data['flows'])
-            }
+        #   (title, flow data) pairs are generated lazily to avoid copying the flows data
+        scripts_data = data.get('scripts')
+        if scripts_data is not None:
+            flows_data = (
+                (title, script_data['flow'])
+                for title, script_data in scripts_data.items()
+            )
         else:
             flows_data = data['flows']
+            if isinstance(flows_data, list):
+                flows_data = (
+                    (f'Flow {i}', flow_data)
+                    for i, flow_data in enumerate(flows_data)
+                )
+            else:
+                flows_data = flows_data.items()
 
-        for title, data in flows_data.items():
-            new_flows.append(self.create_flow(title=title, data=data))
+        for title, flow_data in flows_data:
+            new_flows.append(self.create_flow(title=title, data=flow_data))
+
+        self.flows_loaded.emit(new_flows)
 
         return new_flows
 
@@ -292,13 +346,12 @@ class Session(Base):
         order to include the effects of :code:`Base.complete_data()`.
         """
 
-        return {
-            **super().data(),
-            'flows': {
-                f.title: f.data()
-                for f in self.flows
-            },
-            'addons': {
-                name: addon.data() for name, addon in self.addons.items()
-            }
+        d = super().data()
+        d['flows'] = {
+            f.title: f.data()
+            for f in self.flows
+        }
+        d['addons'] = {
+            name: addon.data() for name, addon in self.addons.items()
         }
+        return d
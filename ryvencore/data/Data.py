@@ -4,10 +4,12 @@ It should be subclassed to define custom data types. In particular, serializatio
 and deserialization must be implemented for each respective type. Types that are
 pickle serializable by default can be used directly with :code`Data(my_data)`.
 """
-from typing import Dict, Type
+import sys
+from functools import lru_cache
+from typing import Dict, Type, FrozenSet
 
 from ..Base import Base
-from ..utils import serialize, deserialize, print_err
+from ..utils import serialize, deserialize, msgpack_serialize, msgpack_deserialize, print_err
 
 class Data(Base):
     """
@@ -79,6 +81,8 @@ class Data(Base):
     [1, 2, 3, 4]
     [1, 2, 3, 4]
     """
+
+    __slots__ = ('_payload',)
     
     # will be 'Data' by default, see :code:`_build_identifier()`
     identifier: str = None
@@ -87,16 +91,40 @@ class Data(Base):
 
     legacy_identifiers = []
     """a list of compatible identifiers in case you change the identifier"""
+
+    serializer: str = 'pickle'
+    """how the result of :code:`get_data()` is serialized, 'pickle' or 'msgpack'.
+    'msgpack' is opt-in (e.g. :code:`Data.serializer = 'msgpack'` for all types)
+    and requires the optional msgpack package (:code:`pip install ryvencore[msgpack]`);
+    data that msgpack cannot represent exactly is still pickled. Notice that
+    projects saved this way need msgpack to restore such data when loading."""
+
+    # frozen version of legacy_identifiers for fast membership tests, built
+    # on class creation since unregistered types are loaded as well
+    _legacy_identifier_set: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_legacy_identifier_set()
+
+    @classmethod
+    def _build_legacy_identifier_set(cls):
+        cls._legacy_identifier_set = frozenset(sys.intern(i) for i in cls.legacy_identifiers)
     
     @classmethod
     def _build_identifier(cls):
         cls.identifier = cls.__name__
+        # legacy_identifiers might have been changed since the class was created
+        cls._build_legacy_identifier_set()
     
     def __init__(self, value=None, load_from=None):
         super().__init__()
 
         if load_from is not None:
             self.load(load_from)
+        elif value is None:
+            # skip the (possibly validating) payload setter for empty data
+            self._payload = None
         else:
             self.payload = value
                 
@@ -129,24 +157,40 @@ class Data(Base):
         self.payload = data     # naive default implementation
 
     def data(self) -> Dict:
-        return {
-            **super().data(),
-            'identifier': self.identifier,
-            'serialized': serialize(self.get_data())
-        }
+        d = super().data()
+        d['identifier'] = self.identifier
+        data = self.get_data()
+        serialized = msgpack_serialize(data) if self.serializer == 'msgpack' else None
+        if serialized is None:
+            d['serialized'] = serialize(data)
+        else:
+            d['serialized'] = serialized
+            d['serializer'] = 'msgpack'
+        return d
 
     def load(self, data: Dict):
         super().load(data)
 
         if data['identifier'] != self.identifier and \
-                data['identifier'] not in self.legacy_identifiers:
+                data['identifier'] not in self._legacy_identifier_set:
             # this should not happen when loading a Flow, because the flow checks
             print_err(f'WARNING: Data identifier {data["identifier"]} '
                       f'is not compatible with {self.identifier}. Skipping.'
                       f'Did you forget to add it to legacy_identifiers?')
             return
 
-        self.set_data(deserialize(data['serialized']))
+        if data.get('serializer') == 'msgpack':
+            try:
+                value = msgpack_deserialize(data['serialized'])
+            except ImportError:
+                print_err(f'WARNING: Data of type {self.identifier} was saved with msgpack, '
+                          f'which is not installed. Skipping. '
+                          f'Install it with: pip install ryvencore[msgpack]')
+                self._payload = None
+                return
+        else:
+            value = deserialize(data['serialized'])
+        self.set_data(value)
 
 # build identifier for Data
 Data._build_identifier()
@@ -154,14 +198,38 @@ Data._build_identifier()
 
 class _BuiltInData(Data):
     """Identifier type for built-in data types"""
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # built-in identifiers don't depend on anything but the class name,
+        # so they are built once, when the class is created
+        cls._build_identifier()
     
     @classmethod
     def _build_identifier(cls):
-        cls.identifier = f'built_in.{cls.__name__}'
+        # checked in the class's own namespace, subclasses need their own identifier
+        if cls.__dict__.get('_identifier_built', False):
+            return
+        super()._build_identifier()
+        cls.identifier = sys.intern(f'built_in.{cls.__name__}')
+        cls._identifier_built = True
 
 _BuiltInData._build_identifier()
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_payload_type(payload_type: type, required_type: type) -> bool:
+    """
+    Cached :code:`issubclass()` for payload validation of built-in data types,
+    whose required types often are ABCs with expensive subclass checks.
+    """
+    return issubclass(payload_type, required_type)
+
+
+# ports only use a small number of different Data types, so results are cached
+@lru_cache(maxsize=512)
 def check_valid_data(out_data_type: Type[Data], inp_data_type: Type[Data]) -> bool:
     """
     Returns true if input data can accept the output data, otherwise false
@@ -169,10 +237,12 @@ def check_valid_data(out_data_type: Type[Data], inp_data_type: Type[Data]) -> bo
     None type is treated as the default Data type
     """
     
-    if inp_data_type is None:
-        inp_data_type = Data
+    if inp_data_type is None or inp_data_type is Data:
+        return True
     if out_data_type is None:
         out_data_type = Data
+    if out_data_type is inp_data_type:
+        return True
     
     return issubclass(out_data_type, inp_data_type)
  
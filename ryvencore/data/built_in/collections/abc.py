@@ -1,6 +1,8 @@
 """Defines abstract structure data types akin to collections.abc"""
 
-from ...Data import _BuiltInData
+from inspect import isabstract
+from typing import FrozenSet
+from ...Data import _BuiltInData, _is_valid_payload_type
 from collections.abc import (
     Container,
     Hashable,
@@ -24,71 +26,123 @@ from collections.abc import (
 
 class _BaseStructureData(_BuiltInData):
     """Base class for any collection"""
+
+    __slots__ = ()
     
     collection_type = None
     """Type from collections module that the payload must conform to"""
 
+    # concrete payload types known to conform to collection_type, checked
+    # before the (cached) ABC subclass check, see __init_subclass__()
+    _accepted_types: FrozenSet[type] = frozenset()
+
+    # whether collection_type can be instantiated, see __init_subclass__()
+    _instantiable: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the collection type doesn't change, so check only once whether it has
+        # abstract methods; mapping views aren't abstract, but need a mapping
+        ct = cls.collection_type
+        cls._instantiable = (
+            ct is not None
+            and not isabstract(ct)
+            and not issubclass(ct, MappingView)
+        )
+        # built from the class's own collection type, so that subclasses
+        # narrowing it don't inherit a wider set
+        cls._accepted_types = (
+            frozenset((ct,)) if ct is not None and not isabstract(ct)
+            else frozenset()
+        )
+
+    def __init__(self, value=None, load_from=None):
+        super().__init__(value, load_from)
+
+        # concrete collection types default to a fresh, empty collection
+        if value is None and load_from is None and self._instantiable:
+            self._payload = self.collection_type()
+
     @property
     def payload(self) -> collection_type:
         return self._payload
     
     @payload.setter
     def payload(self, value):
-        assert isinstance(value, self.collection_type), f'Payload of type {value.__class__} is not of (sub)type {self.collection_type.__class__}'
+        # known types first, it avoids the ABC machinery for concrete types
+        value_type = type(value)
+        assert value_type in self._accepted_types or _is_valid_payload_type(value_type, self.collection_type), f'Payload of type {value.__class__} is not of (sub)type {self.collection_type.__class__}'
         self._payload = value
         
 class ContainerData(_BaseStructureData):
+    __slots__ = ()
     collection_type = Container
 
 class HashableData(_BaseStructureData):
+    __slots__ = ()
     collection_type = Hashable
 
 class IterableData(_BaseStructureData):
+    __slots__ = ()
     collection_type = Iterable
 
 class IteratorData(IterableData):
+    __slots__ = ()
     collection_type = Iterator
 
 class ReversibleData(IterableData):
+    __slots__ = ()
     collection_type = Reversible
 
 class GeneratorData(IteratorData):
+    __slots__ = ()
     collection_type = Generator
 
 class SizedData(_BuiltInData):
+    __slots__ = ()
     collection_type = Sized
 
 class CollectionData(SizedData, IterableData, ContainerData):
+    __slots__ = ()
     collection_type = Collection
 
 class SequenceData(ReversibleData, CollectionData):
+    __slots__ = ()
     collection_type = Sequence
 
 class MutableSequenceData(SequenceData):
+    __slots__ = ()
     collection_type = MutableSequence
 
 class SetData_ABC(CollectionData):
+    __slots__ = ()
     collection_type = Set
 
 class MutableSetData(SetData_ABC):
+    __slots__ = ()
     collection_type = MutableSet
 
 class MappingData(CollectionData):
+    __slots__ = ()
     collection_type = Mapping
 
 class MutableMappingData(MappingData):
+    __slots__ = ()
     collection_type = MutableMapping
 
 class MappingViewData(SizedData):
+    __slots__ = ()
     collection_type = MappingView
 
 class ItemsViewData(MappingViewData, SetData_ABC):
+    __slots__ = ()
     collection_type = ItemsView
 
 class KeysViewData(MappingView, Set):
     collection_type = KeysView
     
 class ValuesViewData(MappingViewData, CollectionData):
+    __slots__ = ()
     collection_type = ValuesView
 
     
\ No newline at end of file
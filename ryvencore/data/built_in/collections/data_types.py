@@ -11,24 +11,31 @@ from .abc import (
 from collections import OrderedDict, deque
 
 class ListData(MutableSequenceData):
+    __slots__ = ()
     collection_type = list
 
 class TupleData(SequenceData):
+    __slots__ = ()
     collection_type = tuple
 
 class DictData(MutableMappingData):
+    __slots__ = ()
     collection_type = dict
 
 class OrderedDictData(MutableMappingData):
+    __slots__ = ()
     collection_type = OrderedDict
 
 class SetData(MutableSetData):
+    __slots__ = ()
     collection_type = set
 
 class FrozenSetData(SetData_ABC):
+    __slots__ = ()
     collection_type = frozenset
 
 class QueueData(MutableSequenceData):
+    __slots__ = ()
     collection_type = deque
 
 
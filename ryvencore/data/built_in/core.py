@@ -1,6 +1,7 @@
 """Defines common data types based on python standard types"""
 
 from ..Data import Data, _BuiltInData
+from ...utils import get_all_subclasses
 from typing import Iterable
 from .collections.abc import SequenceData
  
@@ -9,6 +10,8 @@ class PayloadData(_BuiltInData):
     Data container that checks if the appropriate payload type has been set
     on instantiation.
     """
+
+    __slots__ = ()
     
     payload_type = None
     """
@@ -21,22 +24,17 @@ class PayloadData(_BuiltInData):
         
         # payload initialization if a type is given and the value is not of that type
         if (self.payload_type is not None and self._payload is not None):
-            assert isinstance(self._payload, self.payload_type), f'Payload {self._payload} does not inherit from {self.payload_type}'
+            assert type(self._payload) is self.payload_type or isinstance(self._payload, self.payload_type), f'Payload {self._payload} does not inherit from {self.payload_type}'
             
 
 class StringData(SequenceData):
+    __slots__ = ()
     collection_type = str
 
 class BytesData(SequenceData):
+    __slots__ = ()
     collection_type = bytes
 
-def __get_all_subclasses(cls):
-    subclasses = set(cls.__subclasses__())
-    for subclass in cls.__subclasses__():
-        subclasses.update(__get_all_subclasses(subclass))
-    return subclasses 
-
-
 def get_built_in_data_types() -> Iterable[Data]:
     """Retrieves all the built-in data types"""
-    return __get_all_subclasses(_BuiltInData)
\ No newline at end of file
+    return get_all_subclasses(_BuiltInData)
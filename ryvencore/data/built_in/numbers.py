@@ -1,20 +1,27 @@
 """Defines basic numeric data types"""
 
-from ..Data import _BuiltInData
+from ..Data import _BuiltInData, _is_valid_payload_type
 from numbers import Number, Complex, Real, Rational, Integral
 from fractions import Fraction
 
 class NumberData(_BuiltInData):
     """Base data class for numbers"""
+
+    __slots__ = ()
     
     number_type = Number
     """Type from numbers module that the payload must conform to"""
     
     fallback_type = None
     """Fallback type to attempt instantiation if the value is not of number_type"""
-    
-    def __init__(self, value: number_type, load_from=None):
+
+    def __init__(self, value=None, load_from=None):
         super().__init__(value, load_from)
+
+        # default to zero; compared against None so that 0, 0.0, ... are
+        # regular values. fallback_type() is valid, no need for the setter
+        if value is None and load_from is None:
+            self._payload = self.fallback_type() if self.fallback_type is not None else 0
     
     @property
     def payload(self) -> number_type:
@@ -22,25 +29,38 @@ class NumberData(_BuiltInData):
     
     @payload.setter
     def payload(self, value: number_type):
-        assert isinstance(value, self.number_type), f'Payload of type {value.__class__} is not of (sub)type {self.number_type.__class__}'
+        # values of exactly the fallback type are valid and don't need
+        # a cast, which skips the (ABC) isinstance check for most values
+        value_type = type(value)
+        if value_type is not self.fallback_type:
+            assert _is_valid_payload_type(value_type, self.number_type), f'Payload of type {value.__class__} is not of (sub)type {self.number_type.__class__}'
+
+            # Attempt to cast the given value to the fallback type
+            if self.fallback_type is not None:
+                value = self.fallback_type(value)
 
         self._payload = value
-        # Attempt to cast the given value to the fallback type
-        if self.fallback_type is not None and self._payload.__class__ is not self.fallback_type:
-            self._payload = self.fallback_type(self._payload)
+
+    def get_data(self):
+        # numbers are pickle serializable, no need to go through the property
+        return self._payload
                       
 class ComplexData(NumberData):
+    __slots__ = ()
     number_type = Complex
     fallback_type = complex
     
 class RealData(ComplexData):
+    __slots__ = ()
     number_type = Real
     fallback_type = float
     
 class RationalData(RealData):
+    __slots__ = ()
     number_type = Rational
     fallback_type = Fraction
     
 class IntegerData(RationalData):
+    __slots__ = ()
     number_type = Integral
     fallback_type = int 
@@ -5,7 +5,7 @@ import json
 import pickle
 import sys
 from os.path import dirname, abspath, join, basename
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from packaging.version import Version, parse as _parse_version
 import importlib.util
 
@@ -14,6 +14,12 @@ if sys.version_info < (3, 8):
 else:
     import importlib.metadata as importlib_metadata
 
+# optional, faster serialization of plain data
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 def pkg_version() -> str:
     return importlib_metadata.version('ryvencore')
 
@@ -38,6 +44,29 @@ def deserialize(data):
     return pickle.loads(base64.b64decode(data))
 
 
+def msgpack_serialize(data) -> Optional[str]:
+    """
+    Serializes data using msgpack, which is faster and more compact than pickle,
+    but only supports plain types (None, bool, int, float, str, bytes, list, dict).
+    Returns None if msgpack is not installed or the data cannot be represented
+    exactly, in which case :code:`serialize()` should be used.
+    """
+    if msgpack is None:
+        return None
+    try:
+        # strict types, so e.g. tuples are not silently turned into lists
+        packed = msgpack.packb(data, use_bin_type=True, strict_types=True)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return base64.b64encode(packed).decode('ascii')
+
+
+def msgpack_deserialize(data: str):
+    if msgpack is None:
+        raise ImportError('msgpack is required to deserialize msgpack data')
+    return msgpack.unpackb(base64.b64decode(data), raw=False, strict_map_key=False)
+
+
 def print_err(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
@@ -75,4 +104,21 @@ def load_from_file(file: str, comps: List[str]) -> Tuple:
 
 
 
-    
\ No newline at end of file
+    
+
+def get_all_subclasses(cls: type) -> List[type]:
+    """
+    Returns all direct and indirect subclasses of a class, in the order they
+    are discovered. Each subclass is listed once, even with multiple inheritance.
+    """
+
+    seen = set()
+    result = []
+    stack = [cls]
+    while stack:
+        for sc in stack.pop().__subclasses__():
+            if sc not in seen:
+                seen.add(sc)
+                result.append(sc)
+                stack.append(sc)
+    return result
@@ -1,5 +1,7 @@
 import unittest
 import ryvencore as rc
+from fractions import Fraction
+from collections import OrderedDict
 
 from ryvencore.data.built_in import *
 from ryvencore.data.built_in.collections.abc import *
@@ -145,6 +147,186 @@ class DataTypesBuiltIn(unittest.TestCase):
         n1.set_output_val(1, ListData([1, 2, 3]))
         self.assertTrue(isinstance(n2.input(1), ListData))
 
+
+
+class DataTypesDefaults(unittest.TestCase):
+
+    def runTest(self):
+        # concrete collections default to fresh empty collections
+        self.assertEqual(ListData().payload, [])
+        self.assertEqual(DictData().payload, {})
+        self.assertEqual(SetData().payload, set())
+        self.assertIsNot(ListData().payload, ListData().payload)
+        self.assertEqual(ListData([1, 2]).payload, [1, 2])
+
+        # abstract collections cannot be instantiated
+        self.assertIsNone(SequenceData().payload)
+        # neither can views, they need a mapping
+        self.assertIsNone(ValuesViewData().payload)
+
+        # collection types aren't instantiated when a data type is defined
+        class Strict(list):
+            def __init__(self, *args):
+                raise ValueError('no default')
+
+        class StrictData(ListData):
+            collection_type = Strict
+        self.assertTrue(StrictData._instantiable)
+
+        # numbers default to zero of their fallback type
+        self.assertEqual(NumberData().payload, 0)
+        self.assertIs(type(IntegerData().payload), int)
+        self.assertIs(type(RealData().payload), float)
+        self.assertIs(type(RationalData().payload), Fraction)
+        self.assertEqual(ComplexData().payload, 0j)
+        self.assertIs(type(RealData(0).payload), float)
+
+
+
+class DataTypesNarrowedCollection(unittest.TestCase):
+
+    class MyList(list):
+        pass
+
+    def runTest(self):
+        class MyListData(ListData):
+            collection_type = self.MyList
+
+        # subclasses narrowing the collection type reject the wider one
+        self.assertEqual(MyListData(self.MyList([1, 2])).payload, [1, 2])
+        with self.assertRaises(AssertionError):
+            MyListData([1, 2])
+        self.assertEqual(ListData(self.MyList([1])).payload, [1])
+
+        # the built-in types still accept subtypes
+        self.assertEqual(DictData(OrderedDict(a=1)).payload, {'a': 1})
+        with self.assertRaises(AssertionError):
+            OrderedDictData({'a': 1})
+
+
+
+class DataTypesInputDefaults(unittest.TestCase):
+
+    class Node(rc.Node):
+        def initialize(self):
+            super().initialize()
+            self.create_input(default=IntegerData(3))
+            self.create_input()
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_type(self.Node)
+        s.create_flow('main').create_node(self.Node)
+        project = s.serialize()
+
+        s2 = rc.Session()
+        s2.register_node_type(self.Node)
+        s2.load(project)
+        n = s2.flows[0].nodes[0]
+        # defaults are restored with their own data type
+        self.assertIsInstance(n._inputs[0].default, IntegerData)
+        self.assertEqual(n._inputs[0].default.payload, 3)
+        self.assertIsNone(n._inputs[1].default)
+
+
+
+class DataTypesLegacyIdentifiers(unittest.TestCase):
+
+    class MyList(ListData):
+        legacy_identifiers = ['old.list']
+
+    def runTest(self):
+        self.assertEqual(self.MyList.identifier, 'built_in.MyList')
+        self.assertEqual(ListData.identifier, 'built_in.ListData')
+
+        # data saved under the legacy identifier is accepted
+        data = self.MyList([1, 2]).data()
+        data['identifier'] = 'old.list'
+        self.assertEqual(self.MyList(load_from=data).payload, [1, 2])
+
+        # building the identifier again (e.g. registering it) doesn't change it
+        s = rc.Session()
+        s.register_data_type(self.MyList)
+        self.assertEqual(self.MyList.identifier, 'built_in.MyList')
+        self.assertIs(s.get_data_type('built_in.MyList'), self.MyList)
+
+        # subclasses get their own identifier
+        class MyOtherList(self.MyList):
+            pass
+        self.assertEqual(MyOtherList.identifier, 'built_in.MyOtherList')
+
+        # like for Data, the identifier is built from the class name
+        class NamedList(ListData):
+            identifier = 'my.list'
+        self.assertEqual(NamedList.identifier, 'built_in.NamedList')
+
+        # unregistered types accept their legacy identifiers as well
+        class MyData(Data):
+            legacy_identifiers = ['OldData']
+        data = Data(5).data()
+        data['identifier'] = 'OldData'
+        self.assertEqual(MyData(load_from=data).payload, 5)
+
+
+@unittest.skipUnless(rc.utils.msgpack is not None, 'msgpack is not installed')
+class DataTypesMsgpack(unittest.TestCase):
+
+    def setUp(self):
+        Data.serializer = 'msgpack'
+
+    def tearDown(self):
+        Data.serializer = 'pickle'
+
+    def runTest(self):
+        # plain data is stored with msgpack
+        for d in [
+            ListData([1, 'a', None, 2.5]),
+            DictData({1: 'a', 'b': [1]}),
+            StringData('hé'),
+            BytesData(b'\x00x'),
+            IntegerData(4),
+        ]:
+            data = d.data()
+            self.assertEqual(data.get('serializer'), 'msgpack')
+            loaded = type(d)(load_from=data)
+            self.assertEqual(loaded.payload, d.payload)
+            self.assertIs(type(loaded.payload), type(d.payload))
+
+        # anything msgpack can't represent exactly falls back to pickle
+        for d in [
+            TupleData((1, 2)),
+            ListData([1, (2, 3)]),
+            IntegerData(2 ** 70),
+            OrderedDictData(OrderedDict(a=1)),
+        ]:
+            data = d.data()
+            self.assertNotIn('serializer', data)
+            loaded = type(d)(load_from=data)
+            self.assertEqual(loaded.payload, d.payload)
+            self.assertIs(type(loaded.payload), type(d.payload))
+
+
+class DataTypesMsgpackMissing(unittest.TestCase):
+
+    def setUp(self):
+        self.msgpack = rc.utils.msgpack
+        rc.utils.msgpack = None
+
+    def tearDown(self):
+        rc.utils.msgpack = self.msgpack
+        Data.serializer = 'pickle'
+
+    def runTest(self):
+        # pickle is used if msgpack is requested but not installed
+        Data.serializer = 'msgpack'
+        data = ListData([1, 2]).data()
+        self.assertNotIn('serializer', data)
+        self.assertEqual(ListData(load_from=data).payload, [1, 2])
+
+        # data saved with msgpack is skipped instead of aborting the load
+        data['serializer'] = 'msgpack'
+        self.assertIsNone(ListData(load_from=data).payload)
+
         
 if __name__ == '__main__':
     unittest.main()
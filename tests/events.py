@@ -0,0 +1,76 @@
+import unittest
+from ryvencore.Base import Event
+
+
+class EventPriorities(unittest.TestCase):
+
+    def runTest(self):
+        e = Event(int)
+        calls = []
+
+        def cb_low(x):
+            calls.append(('low', x))
+
+        def cb_high(x):
+            calls.append(('high', x))
+
+        def cb_default(x):
+            calls.append(('default', x))
+
+        e.sub(cb_low, nice=5)
+        e.sub(cb_high, nice=-5)
+        e.sub(cb_default)
+
+        e.emit(1)
+        self.assertEqual(calls, [('high', 1), ('default', 1), ('low', 1)])
+
+        calls.clear()
+        e.unsub(cb_high)
+        e.emit(2)
+        self.assertEqual(calls, [('default', 2), ('low', 2)])
+
+        # re-subscribing with a different priority
+        calls.clear()
+        e.unsub(cb_low)
+        e.sub(cb_low, nice=-1)
+        e.emit(3)
+        self.assertEqual(calls, [('low', 3), ('default', 3)])
+
+        # subscribing twice is not allowed and keeps the priority
+        with self.assertRaises(ValueError):
+            e.sub(cb_low, nice=2)
+        calls.clear()
+        e.emit(4)
+        self.assertEqual(calls, [('low', 4), ('default', 4)])
+
+
+class EventDispatch(unittest.TestCase):
+
+    def runTest(self):
+        e = Event(int)
+        calls = []
+
+        def cb_a(x):
+            calls.append(('a', x))
+
+        def cb_b(x):
+            calls.append(('b', x))
+
+        e.sub(cb_b, nice=1)
+        e.sub(cb_a)
+
+        # emit often enough for the event to generate a dispatch function
+        n = Event._DISPATCH_THRESHOLD + 2
+        for i in range(n):
+            e.emit(i)
+        self.assertEqual(calls, [(c, i) for i in range(n) for c in 'ab'])
+
+        # subscription changes must be respected
+        calls.clear()
+        e.unsub(cb_a)
+        e.emit(-1)
+        self.assertEqual(calls, [('b', -1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import ryvencore as rc
+from ryvencore.FlowExecutor import DataFlowNaive
+from ryvencore.data.built_in import IntegerData
+
+
+class NodePortIndices(unittest.TestCase):
+
+    class Node(rc.Node):
+        init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+        init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+
+    def check_indices(self, n: rc.Node):
+        self.assertEqual([p._index for p in n._inputs], list(range(len(n._inputs))))
+        self.assertEqual([p._index for p in n._outputs], list(range(len(n._outputs))))
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_type(self.Node)
+        n = s.create_flow('main').create_node(self.Node)
+        self.check_indices(n)
+
+        added = []
+        n.input_added.sub(lambda node, index, inp: added.append((index, inp)))
+
+        # insert positions behave like list.insert(), the index is the actual one
+        for insert, expected in [(0, 0), (10, 3), (-1, 3), (-100, 0)]:
+            inp = n.create_input(insert=insert)
+            self.assertIs(n._inputs[expected], inp)
+            self.assertEqual(added[-1], (expected, inp))
+            self.check_indices(n)
+
+        out = n.create_output(insert=10)
+        self.assertIs(n._outputs[-1], out)
+        self.check_indices(n)
+
+        n.delete_input(0)
+        self.check_indices(n)
+        n.delete_input(-1)
+        self.check_indices(n)
+        n.delete_output(-2)
+        self.check_indices(n)
+        self.assertEqual(len(n._inputs), 4)
+        self.assertEqual(len(n._outputs), 2)
+
+
+class NodeExecutorBinding(unittest.TestCase):
+
+    class Node(rc.Node):
+        pass
+
+    def check_bound(self, n: rc.Node):
+        self.assertIs(n._exec_update.__self__, n.flow.executor)
+        self.assertIs(n._exec_set_output_val.__self__, n.flow.executor)
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_type(self.Node)
+        f = s.create_flow('main')
+        n = f.create_node(self.Node)
+        self.check_bound(n)
+
+        f.set_algorithm_mode('data opt')
+        self.check_bound(n)
+
+        # nodes removed while the mode changes are rebound when added again
+        f.remove_node(n)
+        f.set_algorithm_mode('exec')
+        f.add_node(n)
+        self.check_bound(n)
+
+        # so is assigning the executor directly
+        f.executor = DataFlowNaive(f)
+        self.check_bound(n)
+
+
+class NodeOutputAllowedData(unittest.TestCase):
+
+    class Node(rc.Node):
+        init_outputs = [rc.NodeOutputType()]
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_type(self.Node)
+        n = s.create_flow('main').create_node(self.Node)
+        n.set_output_val(0, rc.Data(1))
+
+        # output values are checked against the current allowed data
+        n._outputs[0].allowed_data = IntegerData
+        with self.assertRaises(AssertionError):
+            n.set_output_val(0, rc.Data(1))
+        n.set_output_val(0, IntegerData(1))
+
+        n._outputs[0].allowed_data = None
+        n.set_output_val(0, rc.Data(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+import ryvencore as rc
+
+
+class SessionAddonsLocation(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+
+        # locations that don't exist or aren't directories contain no addons
+        s.register_addons(os.path.join(os.path.dirname(__file__), 'does-not-exist'))
+        s.register_addons(__file__)
+        self.assertEqual(s.addons, {})
+
+
+class SessionNodeIdentifiers(unittest.TestCase):
+
+    class OldNode(rc.Node):
+        pass
+
+    class NewNode(rc.Node):
+        legacy_identifiers = ['OldNode']
+
+    def load_node_type(self, node_types, project, unregister=()):
+        s = rc.Session()
+        s.register_node_types(node_types)
+        for nc in unregister:
+            s.unregister_node(nc)
+        s.load(project)
+        return type(s.flows[0].nodes[0])
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_type(self.OldNode)
+        s.create_flow('main').create_node(self.OldNode)
+        project = s.serialize()
+
+        # a legacy identifier is used if no class has it as its current one
+        self.assertIs(self.load_node_type([self.NewNode], project), self.NewNode)
+
+        # a current identifier wins over another class's legacy identifier
+        self.assertIs(self.load_node_type([self.NewNode, self.OldNode], project), self.OldNode)
+        self.assertIs(self.load_node_type([self.OldNode, self.NewNode], project), self.OldNode)
+
+        # unregistered classes are no longer found, by either identifier
+        self.assertIs(
+            self.load_node_type([self.NewNode, self.OldNode], project, unregister=[self.OldNode]),
+            self.NewNode
+        )
+        with self.assertRaises(Exception):
+            self.load_node_type([self.NewNode], project, unregister=[self.NewNode])
+
+
+ADDON_MODULE = '''
+import ryvencore as rc
+
+class FlowsLoadedAddon(rc.AddOn):
+    name = 'FlowsLoaded'
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def on_flows_loaded(self, flows):
+        self.calls.append(flows)
+
+addon = FlowsLoadedAddon()
+'''
+
+
+class SessionFlowsLoaded(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.create_flow('a')
+        s.create_flow('b')
+        project = s.serialize()
+
+        with tempfile.TemporaryDirectory() as addons_dir:
+            with open(os.path.join(addons_dir, 'FlowsLoaded.py'), 'w') as f:
+                f.write(ADDON_MODULE)
+
+            s2 = rc.Session()
+            s2.register_addons(addons_dir)
+
+        emitted = []
+        s2.flows_loaded.sub(emitted.append)
+        flows = s2.load(project)
+
+        # emitted once, with all flows created by the load
+        self.assertEqual(len(flows), 2)
+        self.assertEqual(emitted, [flows])
+        self.assertEqual(s2.addons['FlowsLoaded'].calls, [flows])
+
+
+if __name__ == '__main__':
+    unittest.main()